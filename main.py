@@ -1,28 +1,259 @@
 import sys
 import sqlite3
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 import json
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLabel, QPushButton, QProgressBar, 
                              QTabWidget, QSpinBox, QLineEdit, QTextEdit, 
                              QGridLayout, QFrame, QScrollArea, QComboBox,
-                             QDialog, QDialogButtonBox, QFormLayout, QCheckBox)
-from PyQt6.QtCore import QTimer, QThread, pyqtSignal, Qt, QPropertyAnimation, QEasingCurve
+                             QDialog, QDialogButtonBox, QFormLayout, QCheckBox,
+                             QGraphicsEllipseItem)
+from PyQt6.QtCore import QTimer, QRect, Qt, QPropertyAnimation, QEasingCurve
 from PyQt6.QtGui import QFont, QPixmap, QPainter, QPen, QColor, QIcon
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import seaborn as sns
+import pyqtgraph as pg
 import numpy as np
-from collections import defaultdict
+from collections import defaultdict, namedtuple
 import warnings
 warnings.filterwarnings('ignore')
 
+# Application-wide stylesheet, widgets are matched by object name
+APP_STYLESHEET = """
+    QMainWindow {
+        background-color: #f5f5f5;
+    }
+    QTabWidget::pane {
+        border: 1px solid #ddd;
+        background-color: white;
+        border-radius: 8px;
+    }
+    QTabBar::tab {
+        background-color: #e0e0e0;
+        border: 1px solid #ccc;
+        padding: 12px 24px;
+        margin-right: 2px;
+        border-top-left-radius: 8px;
+        border-top-right-radius: 8px;
+    }
+    QTabBar::tab:selected {
+        background-color: #4CAF50;
+        color: white;
+    }
+    QTabBar::tab:hover {
+        background-color: #ddd;
+    }
+    
+    QPushButton#refresh_btn {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 5px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton#refresh_btn:hover {
+        background-color: #45a049;
+    }
+    
+    QLabel#user_label {
+        font-size: 18px;
+        font-weight: bold;
+        color: #333;
+        padding: 10px;
+    }
+    QPushButton#settings_btn {
+        background-color: #2196F3;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 5px;
+        font-size: 14px;
+    }
+    QPushButton#settings_btn:hover {
+        background-color: #1976D2;
+    }
+    
+    QLabel#session_label {
+        font-size: 24px;
+        font-weight: bold;
+        color: #4CAF50;
+        margin: 20px;
+    }
+    QLabel#session_label[mode="short_break"] {
+        color: #2196F3;
+    }
+    QLabel#session_label[mode="long_break"] {
+        color: #9C27B0;
+    }
+    QLabel#time_label {
+        font-size: 48px;
+        font-weight: bold;
+        color: #333;
+        margin: 20px;
+    }
+    
+    QPushButton#start_btn, QPushButton#pause_btn, QPushButton#reset_btn {
+        color: white;
+        border: none;
+        padding: 15px 30px;
+        border-radius: 8px;
+        font-size: 16px;
+        font-weight: bold;
+        margin: 5px;
+    }
+    QPushButton#start_btn {
+        background-color: #4CAF50;
+    }
+    QPushButton#start_btn:hover {
+        background-color: #45a049;
+    }
+    QPushButton#pause_btn {
+        background-color: #FF9800;
+    }
+    QPushButton#pause_btn:hover {
+        background-color: #F57C00;
+    }
+    QPushButton#pause_btn:disabled {
+        background-color: #ccc;
+    }
+    QPushButton#reset_btn {
+        background-color: #f44336;
+    }
+    QPushButton#reset_btn:hover {
+        background-color: #d32f2f;
+    }
+    
+    QLabel#task_label {
+        font-size: 14px;
+        font-weight: bold;
+        color: #333;
+    }
+    QLineEdit#task_input {
+        padding: 10px;
+        border: 2px solid #ddd;
+        border-radius: 5px;
+        font-size: 14px;
+    }
+    QLineEdit#task_input:focus {
+        border-color: #4CAF50;
+    }
+    QLabel#session_counter {
+        font-size: 16px;
+        font-weight: bold;
+        color: #666;
+        margin: 10px;
+    }
+    
+    QLabel#profile_header {
+        font-size: 24px;
+        font-weight: bold;
+        color: #333;
+        margin: 20px;
+    }
+    QLabel#total_sessions_label, QLabel#completed_sessions_label,
+    QLabel#total_work_time_label, QLabel#success_rate_label {
+        color: white;
+        padding: 20px;
+        border-radius: 10px;
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QLabel#total_sessions_label {
+        background-color: #4CAF50;
+    }
+    QLabel#completed_sessions_label {
+        background-color: #2196F3;
+    }
+    QLabel#total_work_time_label {
+        background-color: #FF9800;
+    }
+    QLabel#success_rate_label {
+        background-color: #9C27B0;
+    }
+    QLabel#recent_label {
+        font-size: 18px;
+        font-weight: bold;
+        color: #333;
+        margin: 20px 0 10px 0;
+    }
+    QTextEdit#recent_sessions {
+        border: 1px solid #ddd;
+        border-radius: 5px;
+        padding: 10px;
+        background-color: #f9f9f9;
+    }
+"""
+
 class DatabaseManager:
-    def __init__(self):
-        self.conn = sqlite3.connect('pomodoro_data.db')
+    # Columns update_settings is allowed to write
+    SETTINGS_COLUMNS = {
+        'work_duration', 'short_break', 'long_break', 'long_break_interval',
+        'auto_start_breaks', 'auto_start_work', 'sound_enabled', 'username'
+    }
+    
+    def __init__(self, db_path='pomodoro_data.db'):
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        
+        # WAL journal with relaxed syncing: one WAL append per commit, and
+        # stats reads are not blocked while a session is being written
+        if db_path != ':memory:':
+            self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA busy_timeout=5000')
+        self.conn.execute('PRAGMA temp_store=MEMORY')
+        self.conn.execute('PRAGMA cache_size=-8000')
+        self.conn.execute('PRAGMA mmap_size=67108864')
+        
+        # Same SQL text every call, so sqlite3 reuses its cached prepared statement
+        self._insert_sql = '''
+            INSERT INTO sessions (date, ts, session_type, duration, completed, task_name, notes)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        '''
+        
+        # Query result caches keyed by days, cleared on writes and day change
+        self._stats_cache = {}
+        self._summary_cache = {}
+        self._recent_cache = {}
+        self._cache_day = datetime.now().date()
+        self.data_version = 0
+        
+        # Record types built from cursor.description, keyed by column names
+        self._record_types = {}
+        self._settings = None
+        
         self.create_tables()
     
+    def _invalidate_cache(self):
+        self._stats_cache.clear()
+        self._summary_cache.clear()
+        self._recent_cache.clear()
+        self._cache_day = datetime.now().date()
+        self.data_version += 1
+    
+    def _check_cache_day(self):
+        if self._cache_day != datetime.now().date():
+            self._invalidate_cache()
+    
+    def _fetch_records(self, cursor):
+        # Named tuples keep tuple-speed indexing and add attribute access
+        fields = tuple(column[0] for column in cursor.description)
+        record_type = self._record_types.get(fields)
+        if record_type is None:
+            record_type = namedtuple('Record', fields)
+            self._record_types[fields] = record_type
+        return [record_type(*row) for row in cursor.fetchall()]
+    
+    def _ts_limit(self, days):
+        # Unix seconds marking the start of a "last N days" window
+        return int(time.time()) - days * 86400
+    
+    def get_data_version(self):
+        # Bumped whenever cached query results are dropped
+        self._check_cache_day()
+        return self.data_version
+    
     def create_tables(self):
         cursor = self.conn.cursor()
         
@@ -31,6 +262,7 @@ class DatabaseManager:
             CREATE TABLE IF NOT EXISTS sessions (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 date TEXT NOT NULL,
+                ts INTEGER NOT NULL,
                 session_type TEXT NOT NULL,
                 duration INTEGER NOT NULL,
                 completed INTEGER NOT NULL,
@@ -39,6 +271,18 @@ class DatabaseManager:
             )
         ''')
         
+        # Older databases only have the text date, derive ts from it
+        columns = [column['name'] for column in cursor.execute('PRAGMA table_info(sessions)')]
+        if 'ts' not in columns:
+            cursor.execute('ALTER TABLE sessions ADD COLUMN ts INTEGER')
+            cursor.execute("UPDATE sessions SET ts = CAST(strftime('%s', date, 'utc') AS INTEGER) WHERE ts IS NULL")
+        
+        # Every query filters on the time range; type/completed only appear
+        # in CASE and GROUP BY, so an index on them never narrows a search
+        cursor.execute('DROP INDEX IF EXISTS idx_sessions_date')
+        cursor.execute('DROP INDEX IF EXISTS idx_sessions_type_completed')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_sessions_ts ON sessions(ts)')
+        
         # User settings table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS settings (
@@ -66,97 +310,121 @@ class DatabaseManager:
         
         self.conn.commit()
     
+    @staticmethod
+    def make_session_row(session_type, duration, completed, task_name="", notes=""):
+        # Row in the shape expected by add_sessions_bulk, stamped with the current time
+        now = datetime.now()
+        return (now.isoformat(), int(now.timestamp()), session_type,
+                duration, completed, task_name, notes)
+    
     def add_session(self, session_type, duration, completed, task_name="", notes=""):
+        with self.conn:
+            self.conn.execute(self._insert_sql, self.make_session_row(session_type, duration,
+                                                                      completed, task_name, notes))
+        self._invalidate_cache()
+    
+    def add_sessions_bulk(self, rows):
+        # rows: (date, ts, session_type, duration, completed, task_name, notes) tuples,
+        # written in one transaction for imports, restores and buffered writes
+        rows = list(rows)
+        if not rows:
+            return
+        with self.conn:
+            self.conn.executemany(self._insert_sql, rows)
+        self._invalidate_cache()
+    
+    def get_recent_sessions(self, n=10, days=30):
+        self._check_cache_day()
+        key = (n, days)
+        if key in self._recent_cache:
+            return self._recent_cache[key]
+        
         cursor = self.conn.cursor()
+        ts_limit = self._ts_limit(days)
         cursor.execute('''
-            INSERT INTO sessions (date, session_type, duration, completed, task_name, notes)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (datetime.now().isoformat(), session_type, duration, completed, task_name, notes))
-        self.conn.commit()
+            SELECT strftime('%d.%m.%Y %H:%M', date) as disp_date,
+                   session_type, duration, completed, task_name
+            FROM sessions 
+            WHERE ts >= ? 
+            ORDER BY ts DESC
+            LIMIT ?
+        ''', (ts_limit, n))
+        rows = self._fetch_records(cursor)
+        self._recent_cache[key] = rows
+        return rows
     
-    def get_sessions(self, days=30):
+    def get_session_summary(self, days=30):
+        # Per session type totals, shared by the profile cards and the charts
+        self._check_cache_day()
+        if days in self._summary_cache:
+            return self._summary_cache[days]
+        
         cursor = self.conn.cursor()
-        date_limit = (datetime.now() - timedelta(days=days)).isoformat()
+        ts_limit = self._ts_limit(days)
         cursor.execute('''
-            SELECT * FROM sessions 
-            WHERE date >= ? 
-            ORDER BY date DESC
-        ''', (date_limit,))
-        return cursor.fetchall()
+            SELECT session_type,
+                   COUNT(*) as total_sessions,
+                   SUM(completed) as completed_sessions,
+                   SUM(CASE WHEN completed = 1 THEN duration ELSE 0 END) as completed_minutes
+            FROM sessions 
+            WHERE ts >= ?
+            GROUP BY session_type
+            ORDER BY session_type
+        ''', (ts_limit,))
+        summary = {row.session_type: row for row in self._fetch_records(cursor)}
+        self._summary_cache[days] = summary
+        return summary
     
     def get_settings(self):
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM settings ORDER BY id DESC LIMIT 1')
-        return cursor.fetchone()
+        # Settings only change through update_settings, keep the row until then
+        if self._settings is None:
+            cursor = self.conn.cursor()
+            cursor.execute('SELECT * FROM settings ORDER BY id DESC LIMIT 1')
+            self._settings = cursor.fetchone()
+        return self._settings
     
     def update_settings(self, **kwargs):
         cursor = self.conn.cursor()
         # Get current settings
         current = self.get_settings()
-        if current:
-            # Update existing settings
-            for key, value in kwargs.items():
-                cursor.execute(f'UPDATE settings SET {key} = ? WHERE id = ?', (value, current[0]))
+        if current and kwargs:
+            unknown = set(kwargs) - self.SETTINGS_COLUMNS
+            if unknown:
+                raise ValueError(f"Unknown settings: {', '.join(sorted(unknown))}")
+            
+            # Update existing settings in a single statement
+            assignments = ", ".join(f"{key} = ?" for key in kwargs)
+            cursor.execute(f'UPDATE settings SET {assignments} WHERE id = ?',
+                           (*kwargs.values(), current['id']))
         self.conn.commit()
+        self._settings = None
+        self._invalidate_cache()
     
     def get_daily_stats(self, days=7):
+        self._check_cache_day()
+        if days in self._stats_cache:
+            return self._stats_cache[days]
+        
         cursor = self.conn.cursor()
-        date_limit = (datetime.now() - timedelta(days=days)).isoformat()
+        ts_limit = self._ts_limit(days)
         cursor.execute('''
-            SELECT date(date) as day, 
+            SELECT date(ts, 'unixepoch', 'localtime') as day, 
                    COUNT(*) as total_sessions,
                    SUM(CASE WHEN completed = 1 THEN 1 ELSE 0 END) as completed_sessions,
                    SUM(CASE WHEN session_type = 'work' AND completed = 1 THEN duration ELSE 0 END) as work_minutes
             FROM sessions 
-            WHERE date >= ? 
-            GROUP BY date(date)
+            WHERE ts >= ? 
+            GROUP BY day
             ORDER BY day
-        ''', (date_limit,))
-        return cursor.fetchall()
-
-class TimerThread(QThread):
-    time_updated = pyqtSignal(int)
-    timer_finished = pyqtSignal()
-    
-    def __init__(self):
-        super().__init__()
-        self.duration = 0
-        self.remaining = 0
-        self.is_running = False
-        self.is_paused = False
-        
-    def run(self):
-        while self.is_running:
-            if not self.is_paused:
-                self.time_updated.emit(self.remaining)
-                if self.remaining <= 0:
-                    self.is_running = False
-                    self.timer_finished.emit()
-                    break
-                self.remaining -= 1
-            self.msleep(1000)  # Sleep for 1 second
-    
-    def start_timer(self, duration):
-        self.duration = duration
-        self.remaining = duration
-        self.is_running = True
-        self.is_paused = False
-        if not self.isRunning():
-            self.start()
+        ''', (ts_limit,))
+        rows = self._fetch_records(cursor)
+        self._stats_cache[days] = rows
+        return rows
     
-    def pause_timer(self):
-        self.is_paused = True
-    
-    def resume_timer(self):
-        self.is_paused = False
-    
-    def stop_timer(self):
-        self.is_running = False
-        self.is_paused = False
-        self.remaining = 0
-        if self.isRunning():
-            self.quit()
-            self.wait()
+    def close(self):
+        # Fold the WAL back into the main file so no -wal/-shm files linger
+        self.conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        self.conn.close()
 
 class CircularProgressBar(QWidget):
     def __init__(self, parent=None):
@@ -164,132 +432,175 @@ class CircularProgressBar(QWidget):
         self.setMinimumSize(200, 200)
         self.progress = 0
         self.total = 100
+        self.progress_angle = 0
+        
+        # Paint resources reused on every repaint
+        self._bg_pen = QPen(QColor(240, 240, 240), 8)
+        self._fg_pen = QPen(QColor(67, 160, 71), 8)
+        self._rect = QRect(20, 20, self.width()-40, self.height()-40)
         
     def set_progress(self, current, total):
         self.progress = current
         self.total = total
-        self.update()
+        
+        # Only repaint when the arc actually moves
+        progress_angle = int(360 * (total - current) / total) if total > 0 else 0
+        if progress_angle != self.progress_angle:
+            self.progress_angle = progress_angle
+            self.update()
+    
+    def resizeEvent(self, event):
+        self._rect = QRect(20, 20, self.width()-40, self.height()-40)
+        super().resizeEvent(event)
     
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Background circle
-        painter.setPen(QPen(QColor(240, 240, 240), 8))
-        painter.drawEllipse(20, 20, self.width()-40, self.height()-40)
+        painter.setPen(self._bg_pen)
+        painter.drawEllipse(self._rect)
         
         # Progress arc
         if self.total > 0:
-            progress_angle = int(360 * (self.total - self.progress) / self.total)
-            painter.setPen(QPen(QColor(67, 160, 71), 8))
-            painter.drawArc(20, 20, self.width()-40, self.height()-40, 90*16, -progress_angle*16)
+            painter.setPen(self._fg_pen)
+            painter.drawArc(self._rect, 90*16, -self.progress_angle*16)
 
 class StatisticsWidget(QWidget):
+    # Row layout of DatabaseManager.get_daily_stats
+    DAILY_STATS_DTYPE = [('day', 'U10'), ('total_sessions', 'i8'),
+                         ('completed_sessions', 'i8'), ('work_minutes', 'i8')]
+    
     def __init__(self, db_manager):
         super().__init__()
         self.db_manager = db_manager
+        self.data_version = None
         self.init_ui()
         
     def init_ui(self):
         layout = QVBoxLayout()
         
-        # Create matplotlib figure
-        self.figure = Figure(figsize=(12, 8))
-        self.canvas = FigureCanvas(self.figure)
-        layout.addWidget(self.canvas)
+        # Create chart grid, date axes use categorical ticks so no SI prefix
+        charts_layout = QGridLayout()
+        
+        self.daily_plot = pg.PlotWidget(title='Günlük Çalışma Süreleri (Dakika)')
+        self.daily_plot.setLabel('bottom', 'Tarih')
+        self.daily_plot.setLabel('left', 'Dakika')
+        self.daily_plot.getAxis('bottom').enableAutoSIPrefix(False)
+        charts_layout.addWidget(self.daily_plot, 0, 0)
+        
+        self.completion_plot = pg.PlotWidget(title='Oturum Tamamlanma Oranı')
+        self.completion_plot.hideAxis('bottom')
+        self.completion_plot.hideAxis('left')
+        self.completion_plot.setAspectLocked(True)
+        self.completion_plot.invertY(True)  # Qt angle convention, 90° is at the top
+        self.completion_plot.setMouseEnabled(x=False, y=False)
+        charts_layout.addWidget(self.completion_plot, 0, 1)
+        
+        self.trend_plot = pg.PlotWidget(title='Haftalık Tamamlanan Oturum Trendi')
+        self.trend_plot.setLabel('bottom', 'Tarih')
+        self.trend_plot.setLabel('left', 'Tamamlanan Oturum')
+        self.trend_plot.getAxis('bottom').enableAutoSIPrefix(False)
+        self.trend_plot.showGrid(x=True, y=True, alpha=0.3)
+        charts_layout.addWidget(self.trend_plot, 1, 0)
+        
+        self.type_plot = pg.PlotWidget(title='Oturum Türü Dağılımı')
+        self.type_plot.setLabel('bottom', 'Oturum Türü')
+        self.type_plot.setLabel('left', 'Adet')
+        charts_layout.addWidget(self.type_plot, 1, 1)
+        
+        self.plots = (self.daily_plot, self.completion_plot, self.trend_plot, self.type_plot)
+        for plot in self.plots:
+            plot.setBackground('w')
+        
+        layout.addLayout(charts_layout)
         
         # Refresh button
         refresh_btn = QPushButton("İstatistikleri Yenile")
-        refresh_btn.clicked.connect(self.update_charts)
-        refresh_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        refresh_btn.clicked.connect(lambda: self.update_charts())
+        refresh_btn.setObjectName("refresh_btn")
         layout.addWidget(refresh_btn)
         
         self.setLayout(layout)
         self.update_charts()
     
-    def update_charts(self):
-        self.figure.clear()
+    def update_charts(self, summary=None):
+        self.data_version = self.db_manager.get_data_version()
+        for plot in self.plots:
+            plot.clear()
         
         # Get data
-        sessions = self.db_manager.get_sessions(30)
+        if summary is None:
+            summary = self.db_manager.get_session_summary(30)
         daily_stats = self.db_manager.get_daily_stats(7)
         
-        # Create subplots
-        gs = self.figure.add_gridspec(2, 2, height_ratios=[1, 1], width_ratios=[1, 1])
+        # Column views over the fetched rows
+        if daily_stats:
+            daily = np.array(daily_stats, dtype=self.DAILY_STATS_DTYPE)
+            dates = daily['day'].tolist()
+            x = list(range(len(dates)))
         
         # 1. Daily productivity chart
-        ax1 = self.figure.add_subplot(gs[0, 0])
         if daily_stats:
-            dates = [stat[0] for stat in daily_stats]
-            work_minutes = [stat[3] for stat in daily_stats]
+            work_minutes = daily['work_minutes']
             
-            ax1.bar(dates, work_minutes, color='#4CAF50', alpha=0.7)
-            ax1.set_title('Günlük Çalışma Süreleri (Dakika)', fontsize=12, fontweight='bold')
-            ax1.set_xlabel('Tarih')
-            ax1.set_ylabel('Dakika')
-            ax1.tick_params(axis='x', rotation=45)
+            self.daily_plot.addItem(pg.BarGraphItem(x=x, height=work_minutes, width=0.6,
+                                                    brush=QColor(76, 175, 80, 178)))
+            self.daily_plot.getAxis('bottom').setTicks([list(zip(x, dates))])
         
         # 2. Session completion rate
-        ax2 = self.figure.add_subplot(gs[0, 1])
-        if sessions:
-            completed = len([s for s in sessions if s[4] == 1])
-            total = len(sessions)
+        if summary:
+            completed = sum(row.completed_sessions for row in summary.values())
+            total = sum(row.total_sessions for row in summary.values())
             incomplete = total - completed
             
             labels = ['Tamamlanan', 'Yarıda Kalan']
             sizes = [completed, incomplete]
             colors = ['#4CAF50', '#f44336']
             
-            ax2.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
-            ax2.set_title('Oturum Tamamlanma Oranı', fontsize=12, fontweight='bold')
+            self.draw_pie(self.completion_plot, labels, sizes, colors)
         
         # 3. Weekly trend
-        ax3 = self.figure.add_subplot(gs[1, 0])
         if daily_stats:
-            dates = [stat[0] for stat in daily_stats]
-            completed_sessions = [stat[2] for stat in daily_stats]
+            completed_sessions = daily['completed_sessions']
             
-            ax3.plot(dates, completed_sessions, marker='o', color='#2196F3', linewidth=2, markersize=6)
-            ax3.set_title('Haftalık Tamamlanan Oturum Trendi', fontsize=12, fontweight='bold')
-            ax3.set_xlabel('Tarih')
-            ax3.set_ylabel('Tamamlanan Oturum')
-            ax3.tick_params(axis='x', rotation=45)
-            ax3.grid(True, alpha=0.3)
+            self.trend_plot.plot(x, completed_sessions, pen=pg.mkPen('#2196F3', width=2),
+                                 symbol='o', symbolSize=6, symbolBrush='#2196F3')
+            self.trend_plot.getAxis('bottom').setTicks([list(zip(x, dates))])
         
         # 4. Session type distribution
-        ax4 = self.figure.add_subplot(gs[1, 1])
-        if sessions:
-            session_types = {}
-            for session in sessions:
-                session_type = session[2]
-                if session_type not in session_types:
-                    session_types[session_type] = 0
-                session_types[session_type] += 1
-            
-            labels = list(session_types.keys())
-            sizes = list(session_types.values())
+        if summary:
+            labels = list(summary)
+            sizes = [row.total_sessions for row in summary.values()]
             colors = ['#FF9800', '#2196F3', '#9C27B0']
+            x = list(range(len(labels)))
             
-            ax4.bar(labels, sizes, color=colors[:len(labels)])
-            ax4.set_title('Oturum Türü Dağılımı', fontsize=12, fontweight='bold')
-            ax4.set_xlabel('Oturum Türü')
-            ax4.set_ylabel('Adet')
-        
-        self.figure.tight_layout()
-        self.canvas.draw()
+            self.type_plot.addItem(pg.BarGraphItem(x=x, height=sizes, width=0.6,
+                                                   brushes=colors[:len(labels)]))
+            self.type_plot.getAxis('bottom').setTicks([list(zip(x, labels))])
+    
+    def draw_pie(self, plot, labels, sizes, colors):
+        total = sum(sizes)
+        start_angle = 90 * 16
+        for label, size, color in zip(labels, sizes, colors):
+            if size == 0:
+                continue
+            span_angle = int(round(360 * 16 * size / total))
+            
+            # Unit-circle slice, angles in 1/16th of a degree
+            slice_item = QGraphicsEllipseItem(-1, -1, 2, 2)
+            slice_item.setStartAngle(start_angle)
+            slice_item.setSpanAngle(span_angle)
+            slice_item.setBrush(pg.mkBrush(color))
+            slice_item.setPen(pg.mkPen('w'))
+            plot.addItem(slice_item)
+            
+            mid_angle = np.radians((start_angle + span_angle / 2) / 16)
+            text = pg.TextItem(f"{label}\n{size / total * 100:.1f}%", color='k', anchor=(0.5, 0.5))
+            text.setPos(0.6 * np.cos(mid_angle), -0.6 * np.sin(mid_angle))
+            plot.addItem(text)
+            
+            start_angle += span_angle
 
 class SettingsDialog(QDialog):
     def __init__(self, db_manager, parent=None):
@@ -359,14 +670,25 @@ class SettingsDialog(QDialog):
     def load_settings(self):
         settings = self.db_manager.get_settings()
         if settings:
-            self.username_edit.setText(settings[8])
-            self.work_spin.setValue(settings[1])
-            self.short_break_spin.setValue(settings[2])
-            self.long_break_spin.setValue(settings[3])
-            self.long_break_interval_spin.setValue(settings[4])
-            self.auto_start_breaks_check.setChecked(bool(settings[5]))
-            self.auto_start_work_check.setChecked(bool(settings[6]))
-            self.sound_enabled_check.setChecked(bool(settings[7]))
+            # Silence change notifications while filling the form
+            widgets = (self.username_edit, self.work_spin, self.short_break_spin,
+                       self.long_break_spin, self.long_break_interval_spin,
+                       self.auto_start_breaks_check, self.auto_start_work_check,
+                       self.sound_enabled_check)
+            for widget in widgets:
+                widget.blockSignals(True)
+            
+            self.username_edit.setText(settings['username'])
+            self.work_spin.setValue(settings['work_duration'])
+            self.short_break_spin.setValue(settings['short_break'])
+            self.long_break_spin.setValue(settings['long_break'])
+            self.long_break_interval_spin.setValue(settings['long_break_interval'])
+            self.auto_start_breaks_check.setChecked(bool(settings['auto_start_breaks']))
+            self.auto_start_work_check.setChecked(bool(settings['auto_start_work']))
+            self.sound_enabled_check.setChecked(bool(settings['sound_enabled']))
+            
+            for widget in widgets:
+                widget.blockSignals(False)
     
     def save_settings(self):
         self.db_manager.update_settings(
@@ -382,16 +704,51 @@ class SettingsDialog(QDialog):
         self.accept()
 
 class PomodoroApp(QMainWindow):
+    # Longest a finished session waits in memory before it is written, kept
+    # short so a crash or kill without closeEvent loses at most a few seconds
+    FLUSH_INTERVAL_MS = 3000
+    
     def __init__(self):
         super().__init__()
         self.db_manager = DatabaseManager()
-        self.timer_thread = TimerThread()
-        self.timer_thread.time_updated.connect(self.update_timer_display)
-        self.timer_thread.timer_finished.connect(self.timer_finished)
+        
+        # 1 second tick driven from the GUI thread, remaining time is measured
+        # against a monotonic deadline so late ticks never accumulate drift
+        self.tick = QTimer(self)
+        self.tick.setTimerType(Qt.TimerType.CoarseTimer)
+        self.tick.setInterval(1000)
+        self.tick.timeout.connect(self._on_tick)
+        # One-shot that brings a resumed countdown back onto whole seconds
+        self.resume_tick = QTimer(self)
+        self.resume_tick.setSingleShot(True)
+        self.resume_tick.timeout.connect(self._on_resume_tick)
+        self.remaining = 0
+        self._end_monotonic = 0.0
+        self._paused_remaining = 0.0
+        
+        # Finished sessions waiting to be written in one transaction. They are
+        # flushed on pause, reset, leaving the timer tab, close, or after
+        # FLUSH_INTERVAL_MS, whichever comes first
+        self._pending_sessions = []
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self._flush_sessions)
         
         self.current_session = 0
         self.session_type = "work"  # work, short_break, long_break
         self.is_running = False
+        self.is_paused = False
+        
+        # Timer settings, refreshed from the database by load_settings
+        self.work_duration = 25
+        self.short_break_duration = 5
+        self.long_break_duration = 15
+        self.long_break_interval = 4
+        self.auto_start_breaks = False
+        self.auto_start_work = False
+        self.sound_enabled = True
+        self.refresh_session_length()
         
         self.init_ui()
         self.load_settings()
@@ -400,33 +757,6 @@ class PomodoroApp(QMainWindow):
         self.setWindowTitle("Modern Pomodoro Timer")
         self.setGeometry(100, 100, 1200, 800)
         
-        # Apply modern styling
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QTabWidget::pane {
-                border: 1px solid #ddd;
-                background-color: white;
-                border-radius: 8px;
-            }
-            QTabBar::tab {
-                background-color: #e0e0e0;
-                border: 1px solid #ccc;
-                padding: 12px 24px;
-                margin-right: 2px;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-            }
-            QTabBar::tab:selected {
-                background-color: #4CAF50;
-                color: white;
-            }
-            QTabBar::tab:hover {
-                background-color: #ddd;
-            }
-        """)
-        
         # Central widget with tabs
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -438,11 +768,14 @@ class PomodoroApp(QMainWindow):
         
         # Timer tab
         self.timer_tab = self.create_timer_tab()
-        self.tabs.addTab(self.timer_tab, "🍅 Pomodoro")
+        self.timer_index = self.tabs.addTab(self.timer_tab, "🍅 Pomodoro")
         
-        # Statistics tab
-        self.stats_tab = StatisticsWidget(self.db_manager)
-        self.tabs.addTab(self.stats_tab, "📊 İstatistikler")
+        # Statistics tab, charts are built the first time the tab is shown
+        self.stats_tab = None
+        self.stats_container = QWidget()
+        QVBoxLayout(self.stats_container).setContentsMargins(0, 0, 0, 0)
+        self.stats_index = self.tabs.addTab(self.stats_container, "📊 İstatistikler")
+        self.tabs.currentChanged.connect(self.on_tab_changed)
         
         # Profile tab
         self.profile_tab = self.create_profile_tab()
@@ -462,14 +795,7 @@ class PomodoroApp(QMainWindow):
         header_layout = QHBoxLayout()
         
         self.user_label = QLabel("Merhaba, Kullanıcı!")
-        self.user_label.setStyleSheet("""
-            QLabel {
-                font-size: 18px;
-                font-weight: bold;
-                color: #333;
-                padding: 10px;
-            }
-        """)
+        self.user_label.setObjectName("user_label")
         header_layout.addWidget(self.user_label)
         
         header_layout.addStretch()
@@ -477,19 +803,7 @@ class PomodoroApp(QMainWindow):
         # Settings button
         settings_btn = QPushButton("⚙️ Ayarlar")
         settings_btn.clicked.connect(self.open_settings)
-        settings_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 5px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-        """)
+        settings_btn.setObjectName("settings_btn")
         header_layout.addWidget(settings_btn)
         
         layout.addLayout(header_layout)
@@ -500,14 +814,8 @@ class PomodoroApp(QMainWindow):
         # Session type label
         self.session_label = QLabel("Çalışma Oturumu")
         self.session_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.session_label.setStyleSheet("""
-            QLabel {
-                font-size: 24px;
-                font-weight: bold;
-                color: #4CAF50;
-                margin: 20px;
-            }
-        """)
+        self.session_label.setObjectName("session_label")
+        self.session_label.setProperty("mode", "work")
         timer_layout.addWidget(self.session_label)
         
         # Circular progress bar
@@ -517,14 +825,7 @@ class PomodoroApp(QMainWindow):
         # Time display
         self.time_label = QLabel("25:00")
         self.time_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.time_label.setStyleSheet("""
-            QLabel {
-                font-size: 48px;
-                font-weight: bold;
-                color: #333;
-                margin: 20px;
-            }
-        """)
+        self.time_label.setObjectName("time_label")
         timer_layout.addWidget(self.time_label)
         
         # Control buttons
@@ -532,63 +833,18 @@ class PomodoroApp(QMainWindow):
         
         self.start_btn = QPushButton("▶️ Başlat")
         self.start_btn.clicked.connect(self.start_timer)
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 15px 30px;
-                border-radius: 8px;
-                font-size: 16px;
-                font-weight: bold;
-                margin: 5px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        self.start_btn.setObjectName("start_btn")
         button_layout.addWidget(self.start_btn)
         
         self.pause_btn = QPushButton("⏸️ Duraklat")
         self.pause_btn.clicked.connect(self.pause_timer)
         self.pause_btn.setEnabled(False)
-        self.pause_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FF9800;
-                color: white;
-                border: none;
-                padding: 15px 30px;
-                border-radius: 8px;
-                font-size: 16px;
-                font-weight: bold;
-                margin: 5px;
-            }
-            QPushButton:hover {
-                background-color: #F57C00;
-            }
-            QPushButton:disabled {
-                background-color: #ccc;
-            }
-        """)
+        self.pause_btn.setObjectName("pause_btn")
         button_layout.addWidget(self.pause_btn)
         
         self.reset_btn = QPushButton("🔄 Sıfırla")
         self.reset_btn.clicked.connect(self.reset_timer)
-        self.reset_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                border: none;
-                padding: 15px 30px;
-                border-radius: 8px;
-                font-size: 16px;
-                font-weight: bold;
-                margin: 5px;
-            }
-            QPushButton:hover {
-                background-color: #d32f2f;
-            }
-        """)
+        self.reset_btn.setObjectName("reset_btn")
         button_layout.addWidget(self.reset_btn)
         
         timer_layout.addLayout(button_layout)
@@ -597,35 +853,18 @@ class PomodoroApp(QMainWindow):
         task_layout = QVBoxLayout()
         
         task_label = QLabel("Görev:")
-        task_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #333;")
+        task_label.setObjectName("task_label")
         task_layout.addWidget(task_label)
         
         self.task_input = QLineEdit()
         self.task_input.setPlaceholderText("Üzerinde çalışacağınız görevi girin...")
-        self.task_input.setStyleSheet("""
-            QLineEdit {
-                padding: 10px;
-                border: 2px solid #ddd;
-                border-radius: 5px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border-color: #4CAF50;
-            }
-        """)
+        self.task_input.setObjectName("task_input")
         task_layout.addWidget(self.task_input)
         
         # Session counter
         self.session_counter = QLabel("Oturum: 0/4")
         self.session_counter.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.session_counter.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                font-weight: bold;
-                color: #666;
-                margin: 10px;
-            }
-        """)
+        self.session_counter.setObjectName("session_counter")
         task_layout.addWidget(self.session_counter)
         
         layout.addLayout(timer_layout)
@@ -640,14 +879,7 @@ class PomodoroApp(QMainWindow):
         # Profile header
         profile_header = QLabel("Kullanıcı Profili")
         profile_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        profile_header.setStyleSheet("""
-            QLabel {
-                font-size: 24px;
-                font-weight: bold;
-                color: #333;
-                margin: 20px;
-            }
-        """)
+        profile_header.setObjectName("profile_header")
         layout.addWidget(profile_header)
         
         # Profile stats
@@ -656,88 +888,38 @@ class PomodoroApp(QMainWindow):
         # Total sessions
         self.total_sessions_label = QLabel("Toplam Oturum\n0")
         self.total_sessions_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.total_sessions_label.setStyleSheet("""
-            QLabel {
-                background-color: #4CAF50;
-                color: white;
-                padding: 20px;
-                border-radius: 10px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-        """)
+        self.total_sessions_label.setObjectName("total_sessions_label")
         stats_layout.addWidget(self.total_sessions_label, 0, 0)
         
         # Completed sessions
         self.completed_sessions_label = QLabel("Tamamlanan\n0")
         self.completed_sessions_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.completed_sessions_label.setStyleSheet("""
-            QLabel {
-                background-color: #2196F3;
-                color: white;
-                padding: 20px;
-                border-radius: 10px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-        """)
+        self.completed_sessions_label.setObjectName("completed_sessions_label")
         stats_layout.addWidget(self.completed_sessions_label, 0, 1)
         
         # Total work time
         self.total_work_time_label = QLabel("Toplam Çalışma\n0 dakika")
         self.total_work_time_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.total_work_time_label.setStyleSheet("""
-            QLabel {
-                background-color: #FF9800;
-                color: white;
-                padding: 20px;
-                border-radius: 10px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-        """)
+        self.total_work_time_label.setObjectName("total_work_time_label")
         stats_layout.addWidget(self.total_work_time_label, 1, 0)
         
         # Success rate
         self.success_rate_label = QLabel("Başarı Oranı\n0%")
         self.success_rate_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.success_rate_label.setStyleSheet("""
-            QLabel {
-                background-color: #9C27B0;
-                color: white;
-                padding: 20px;
-                border-radius: 10px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-        """)
+        self.success_rate_label.setObjectName("success_rate_label")
         stats_layout.addWidget(self.success_rate_label, 1, 1)
         
         layout.addLayout(stats_layout)
         
         # Recent sessions
         recent_label = QLabel("Son Oturumlar")
-        recent_label.setStyleSheet("""
-            QLabel {
-                font-size: 18px;
-                font-weight: bold;
-                color: #333;
-                margin: 20px 0 10px 0;
-            }
-        """)
+        recent_label.setObjectName("recent_label")
         layout.addWidget(recent_label)
         
         self.recent_sessions = QTextEdit()
         self.recent_sessions.setReadOnly(True)
         self.recent_sessions.setMaximumHeight(200)
-        self.recent_sessions.setStyleSheet("""
-            QTextEdit {
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                padding: 10px;
-                background-color: #f9f9f9;
-            }
-        """)
+        self.recent_sessions.setObjectName("recent_sessions")
         layout.addWidget(self.recent_sessions)
         
         layout.addStretch()
@@ -747,26 +929,27 @@ class PomodoroApp(QMainWindow):
     def load_settings(self):
         settings = self.db_manager.get_settings()
         if settings:
-            self.work_duration = settings[1]
-            self.short_break_duration = settings[2]
-            self.long_break_duration = settings[3]
-            self.long_break_interval = settings[4]
-            self.auto_start_breaks = bool(settings[5])
-            self.auto_start_work = bool(settings[6])
-            self.sound_enabled = bool(settings[7])
-            username = settings[8]
+            self.work_duration = settings['work_duration']
+            self.short_break_duration = settings['short_break']
+            self.long_break_duration = settings['long_break']
+            self.long_break_interval = settings['long_break_interval']
+            self.auto_start_breaks = bool(settings['auto_start_breaks'])
+            self.auto_start_work = bool(settings['auto_start_work'])
+            self.sound_enabled = bool(settings['sound_enabled'])
+            username = settings['username']
             
             self.user_label.setText(f"Merhaba, {username}!")
+            self.refresh_session_length()
             self.update_timer_display(self.work_duration * 60)
             
         self.update_profile_stats()
         
-    def update_profile_stats(self):
-        sessions = self.db_manager.get_sessions(30)
-        
-        total_sessions = len(sessions)
-        completed_sessions = len([s for s in sessions if s[4] == 1])
-        total_work_time = sum([s[3] for s in sessions if s[2] == 'work' and s[4] == 1])
+    def update_profile_stats(self, summary=None):
+        if summary is None:
+            summary = self.db_manager.get_session_summary(30)
+        total_sessions = sum(row.total_sessions for row in summary.values())
+        completed_sessions = sum(row.completed_sessions for row in summary.values())
+        total_work_time = summary['work'].completed_minutes if 'work' in summary else 0
         success_rate = (completed_sessions / total_sessions * 100) if total_sessions > 0 else 0
         
         self.total_sessions_label.setText(f"Toplam Oturum\n{total_sessions}")
@@ -775,18 +958,33 @@ class PomodoroApp(QMainWindow):
         self.success_rate_label.setText(f"Başarı Oranı\n{success_rate:.1f}%")
         
         # Update recent sessions
-        recent_text = ""
-        for session in sessions[:10]:  # Show last 10 sessions
-            date = datetime.fromisoformat(session[1]).strftime("%d.%m.%Y %H:%M")
-            session_type = session[2]
-            duration = session[3]
-            completed = "✅" if session[4] == 1 else "❌"
-            task_name = session[5] if session[5] else "Görev belirtilmedi"
+        sessions = self.db_manager.get_recent_sessions(10)
+        recent_lines = []
+        for session in sessions:  # Show last 10 sessions
+            date = session.disp_date
+            session_type = session.session_type
+            duration = session.duration
+            completed = "✅" if session.completed == 1 else "❌"
+            task_name = session.task_name if session.task_name else "Görev belirtilmedi"
             
-            recent_text += f"{date} - {session_type.title()} ({duration} dk) {completed} - {task_name}\n"
+            recent_lines.append(f"{date} - {session_type.title()} ({duration} dk) {completed} - {task_name}")
         
-        self.recent_sessions.setPlainText(recent_text)
+        self.recent_sessions.setPlainText("\n".join(recent_lines))
         
+    def on_tab_changed(self, index):
+        # Profile and stats tabs must show sessions still in the queue
+        if index != self.timer_index:
+            self._flush_sessions()
+        if index == self.stats_index:
+            self.refresh_stats_tab()
+            
+    def refresh_stats_tab(self, summary=None):
+        if self.stats_tab is None:
+            self.stats_tab = StatisticsWidget(self.db_manager)
+            self.stats_container.layout().addWidget(self.stats_tab)
+        elif self.stats_tab.data_version != self.db_manager.get_data_version():
+            self.stats_tab.update_charts(summary)
+            
     def open_settings(self):
         dialog = SettingsDialog(self.db_manager, self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
@@ -794,42 +992,55 @@ class PomodoroApp(QMainWindow):
             
     def start_timer(self):
         if not self.is_running:
-            duration = self.get_current_duration()
-            self.timer_thread.start_timer(duration * 60)
+            self.remaining = self._current_total_seconds
+            self._end_monotonic = time.monotonic() + self.remaining
+            self.update_timer_display(self.remaining)
+            self.tick.start()
             self.is_running = True
+            self.is_paused = False
             self.start_btn.setEnabled(False)
             self.pause_btn.setEnabled(True)
             self.status_label.setText(f"{self.session_type.title()} oturumu başladı")
-        elif self.timer_thread.is_paused:
-            self.timer_thread.resume_timer()
+        elif self.is_paused:
+            self._resume_countdown()
+            self.is_paused = False
             self.start_btn.setEnabled(False)
             self.pause_btn.setEnabled(True)
             self.status_label.setText("Devam ediyor")
             
     def pause_timer(self):
-        if self.is_running and not self.timer_thread.is_paused:
-            self.timer_thread.pause_timer()
+        if self.is_running and not self.is_paused:
+            self.tick.stop()
+            self.resume_tick.stop()
+            self._paused_remaining = max(0.0, self._end_monotonic - time.monotonic())
+            self.is_paused = True
             self.start_btn.setEnabled(True)
             self.start_btn.setText("▶️ Devam Et")
             self.pause_btn.setEnabled(False)
             self.status_label.setText("Durakladı")
-        elif self.is_running and self.timer_thread.is_paused:
-            self.timer_thread.resume_timer()
+            self._flush_sessions()
+        elif self.is_running and self.is_paused:
+            self._resume_countdown()
+            self.is_paused = False
             self.start_btn.setEnabled(False)
             self.start_btn.setText("▶️ Başlat")
             self.pause_btn.setEnabled(True)
             self.status_label.setText("Devam ediyor")
             
     def reset_timer(self):
-        self.timer_thread.stop_timer()
+        self.tick.stop()
+        self.resume_tick.stop()
+        self.remaining = 0
         self.is_running = False
+        self.is_paused = False
         self.start_btn.setEnabled(True)
         self.start_btn.setText("▶️ Başlat")
         self.pause_btn.setEnabled(False)
         
-        duration = self.get_current_duration()
-        self.update_timer_display(duration * 60)
+        self.refresh_session_length()
+        self.update_timer_display(self._current_total_seconds)
         self.status_label.setText("Sıfırlandı")
+        self._flush_sessions()
         
     def get_current_duration(self):
         if self.session_type == "work":
@@ -839,35 +1050,102 @@ class PomodoroApp(QMainWindow):
         else:  # long_break
             return self.long_break_duration
             
+    def refresh_session_length(self):
+        # Call whenever session_type or the durations change
+        self._current_total_seconds = self.get_current_duration() * 60
+        self._time_strings = tuple(f"{s // 60:02d}:{s % 60:02d}"
+                                   for s in range(self._current_total_seconds + 1))
+        # Force the next update_timer_display to paint
+        self._last_seconds = -1
+            
+    def _resume_countdown(self):
+        # The first tick waits out the fraction of a second left at pause
+        # time, so later ticks land on whole seconds again
+        self._end_monotonic = time.monotonic() + self._paused_remaining
+        self.resume_tick.start(int(self._paused_remaining % 1 * 1000))
+            
+    def _on_resume_tick(self):
+        self.tick.start()
+        self._on_tick()
+            
+    def _on_tick(self):
+        # round() absorbs coarse timer jitter around the whole second
+        self.remaining = max(0, round(self._end_monotonic - time.monotonic()))
+        self.update_timer_display(self.remaining)
+        if self.remaining <= 0:
+            self.tick.stop()
+            self.timer_finished()
+            
     def update_timer_display(self, seconds):
-        minutes = seconds // 60
-        secs = seconds % 60
-        self.time_label.setText(f"{minutes:02d}:{secs:02d}")
+        # Same seconds means same text and arc, nothing to update
+        if seconds == self._last_seconds:
+            return
+        self._last_seconds = seconds
+        
+        if 0 <= seconds < len(self._time_strings):
+            time_text = self._time_strings[seconds]
+        else:
+            minutes, secs = divmod(seconds, 60)
+            time_text = f"{minutes:02d}:{secs:02d}"
+        self.time_label.setText(time_text)
         
         # Update progress bar
-        total_seconds = self.get_current_duration() * 60
-        self.progress_bar.set_progress(seconds, total_seconds)
+        self.progress_bar.set_progress(seconds, self._current_total_seconds)
         
     def timer_finished(self):
         self.is_running = False
+        self.is_paused = False
         self.start_btn.setEnabled(True)
         self.start_btn.setText("▶️ Başlat")
         self.pause_btn.setEnabled(False)
         
-        # Save session to database
+        # Queue session, stats are refreshed once it is flushed
         task_name = self.task_input.text()
         duration = self.get_current_duration()
-        self.db_manager.add_session(self.session_type, duration, 1, task_name)
+        self.queue_session(self.session_type, duration, 1, task_name)
         
         # Move to next session
         self.move_to_next_session()
         
-        # Update stats
-        self.update_profile_stats()
-        self.stats_tab.update_charts()
-        
         self.status_label.setText(f"{self.session_type.title()} oturumu tamamlandı!")
         
+    def queue_session(self, session_type, duration, completed, task_name=""):
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+        self._pending_sessions.append(
+            self.db_manager.make_session_row(session_type, duration, completed, task_name))
+        # Stats are on screen, so write now rather than show stale numbers
+        if self.tabs.currentIndex() != self.timer_index:
+            self._flush_sessions()
+        
+    def _flush_sessions(self):
+        self.flush_timer.stop()
+        if not self._pending_sessions:
+            return
+        self.db_manager.add_sessions_bulk(self._pending_sessions)
+        self._pending_sessions = []
+        
+        # Update stats from a single summary read
+        summary = self.db_manager.get_session_summary(30)
+        self.update_profile_stats(summary)
+        if self.tabs.currentIndex() == self.stats_index:
+            self.refresh_stats_tab(summary)
+        
+    def closeEvent(self, event):
+        self.tick.stop()
+        self.resume_tick.stop()
+        self._flush_sessions()
+        self.db_manager.close()
+        super().closeEvent(event)
+        
+    def set_session_mode(self, mode):
+        # Colour comes from APP_STYLESHEET via the mode property, repolish only on change
+        if self.session_label.property("mode") == mode:
+            return
+        self.session_label.setProperty("mode", mode)
+        self.session_label.style().unpolish(self.session_label)
+        self.session_label.style().polish(self.session_label)
+        
     def move_to_next_session(self):
         if self.session_type == "work":
             self.current_session += 1
@@ -875,43 +1153,20 @@ class PomodoroApp(QMainWindow):
             if self.current_session % self.long_break_interval == 0:
                 self.session_type = "long_break"
                 self.session_label.setText("Uzun Mola")
-                self.session_label.setStyleSheet("""
-                    QLabel {
-                        font-size: 24px;
-                        font-weight: bold;
-                        color: #9C27B0;
-                        margin: 20px;
-                    }
-                """)
             else:
                 self.session_type = "short_break"
                 self.session_label.setText("Kısa Mola")
-                self.session_label.setStyleSheet("""
-                    QLabel {
-                        font-size: 24px;
-                        font-weight: bold;
-                        color: #2196F3;
-                        margin: 20px;
-                    }
-                """)
         else:
             self.session_type = "work"
             self.session_label.setText("Çalışma Oturumu")
-            self.session_label.setStyleSheet("""
-                QLabel {
-                    font-size: 24px;
-                    font-weight: bold;
-                    color: #4CAF50;
-                    margin: 20px;
-                }
-            """)
+        self.set_session_mode(self.session_type)
+        self.refresh_session_length()
             
         # Update session counter
         self.session_counter.setText(f"Oturum: {self.current_session}/{self.long_break_interval}")
         
         # Update timer display
-        duration = self.get_current_duration()
-        self.update_timer_display(duration * 60)
+        self.update_timer_display(self._current_total_seconds)
         
         # Auto-start if enabled
         if ((self.session_type != "work" and self.auto_start_breaks) or 
@@ -924,6 +1179,7 @@ def main():
     
     # Set application style
     app.setStyle('Fusion')
+    app.setStyleSheet(APP_STYLESHEET)
     
     # Create and show the main window
     window = PomodoroApp()